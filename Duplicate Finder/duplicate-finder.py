@@ -1,35 +1,88 @@
 import os
 import hashlib
 import json  # Import for generating reports
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+HEAD_SIZE = 4096  # Bytes compared before committing to a full hash
+HASH_CHUNK_SIZE = 1024 * 1024
+# hashlib releases the GIL while hashing large buffers, so files hash in parallel
+HASH_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+def iter_files(directory):
+    """Yield a DirEntry for every file under directory, without following symlinked folders."""
+    stack = [directory]
+    while stack:
+        try:
+            subdirs = []
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+            # Push in reverse so folders are visited in listing order, as os.walk does
+            stack.extend(reversed(subdirs))
+        except OSError:
+            continue  # Unreadable folder, skip it like os.walk does
+
+def get_file_head(filepath):
+    """Return the first HEAD_SIZE bytes of a file."""
+    with open(filepath, 'rb') as f:
+        return f.read(HEAD_SIZE)
 
 def get_file_hash(filepath):
-    """Return the MD5 hash of a file."""
-    hasher = hashlib.md5()
-    with open(filepath, 'rb') as f:
-        buf = f.read()
-        hasher.update(buf)
+    """Return the SHA-256 hash of a file, read in chunks."""
+    hasher = hashlib.sha256()
+    # One reused buffer keeps memory flat no matter how large the file is
+    buf = memoryview(bytearray(HASH_CHUNK_SIZE))
+    with open(filepath, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            hasher.update(buf[:n])
     return hasher.hexdigest()
 
 def find_duplicates(directory, min_size=0, file_extensions=None):
-    """Find duplicate files in a directory, with optional file type filtering."""
-    hashes = {}
-    duplicates = {}
+    """Find duplicate files in a directory, with optional file type filtering.
+
+    Files are grouped by size first, then by their first few KiB, and only
+    files that still collide are fully hashed.
+    """
+    by_size = defaultdict(list)
+    # Built once so each file is checked with a single endswith() call
+    suffixes = tuple(ext.lower() for ext in file_extensions) if file_extensions else None
 
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            if file_extensions and not filename.lower().endswith(tuple(file_extensions)):
-                continue  # Skip files that don't match the extensions
-
-            filepath = os.path.join(dirpath, filename)
-            if os.path.getsize(filepath) >= min_size:
-                file_hash = get_file_hash(filepath)
-                if file_hash in hashes:
-                    duplicates.setdefault(file_hash, []).append(filepath)
-                    # Also ensure the original file is in the duplicates list
-                    if hashes[file_hash] not in duplicates[file_hash]:
-                        duplicates[file_hash].append(hashes[file_hash])
-                else:
-                    hashes[file_hash] = filepath
+    for entry in iter_files(directory):
+        if suffixes and not entry.name.lower().endswith(suffixes):
+            continue  # Skip files that don't match the extensions
+
+        # Cached on the entry; on Windows it comes straight from the directory listing
+        size = entry.stat().st_size
+        if size >= min_size:
+            by_size[size].append(entry.path)
+
+    duplicates = {}
+    to_hash = []
+    for size, paths in by_size.items():
+        if len(paths) < 2:
+            continue  # A unique size can't have a duplicate
+
+        by_head = defaultdict(list)
+        for filepath in paths:
+            by_head[get_file_head(filepath)].append(filepath)
+
+        for candidates in by_head.values():
+            if len(candidates) < 2:
+                continue
+            if size <= HEAD_SIZE:
+                # The head already covers the whole file
+                duplicates[get_file_hash(candidates[0])] = candidates
+                continue
+            to_hash.extend(candidates)
+
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        # map() keeps the scan order, so the path kept on delete/move is stable between runs
+        for filepath, file_hash in zip(to_hash, pool.map(get_file_hash, to_hash)):
+            duplicates.setdefault(file_hash, []).append(filepath)
 
     return {k: v for k, v in duplicates.items() if len(v) > 1}
 
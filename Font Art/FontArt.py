@@ -1,21 +1,28 @@
+import functools
 import os
+import pickle
 import random
-from typing import List
+from typing import Dict, List, Tuple
 
+import pyfiglet
 from pyfiglet import Figlet, FigletFont
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 
 APP_TITLE_TEXT = "Font Art"
+TITLE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "fontart", "titles.pkl")
+TITLE_CACHE_MAX_WIDTHS = 4  # column buckets kept on disk; the least recently used are dropped
 
 
-def list_figlet_fonts() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def list_figlet_fonts() -> Tuple[str, ...]:
+    # getFonts() rescans the pyfiglet font directory, so only do it once per process
     try:
-        return sorted(FigletFont.getFonts())
+        return tuple(sorted(FigletFont.getFonts()))
     except Exception:
         # Fallback: a small known-good subset if pyfiglet fails
-        return [
+        return (
             "standard",
             "slant",
             "big",
@@ -26,7 +33,59 @@ def list_figlet_fonts() -> List[str]:
             "roman",
             "script",
             "shadow",
-        ]
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def make_figlet(font: str, width: int = 80, justify: str = "auto") -> Figlet:
+    # Building a Figlet reads and parses the .flf font file, so reuse instances
+    return Figlet(font=font, width=width, justify=justify)
+
+
+def _title_cache_key() -> Tuple[str, str, Tuple[str, ...]]:
+    # Art is only reusable for the same title, pyfiglet release and installed fonts
+    return (APP_TITLE_TEXT, getattr(pyfiglet, "__version__", ""), list_figlet_fonts())
+
+
+def load_title_cache() -> Tuple[Dict[Tuple[str, int], str], List[int]]:
+    # Title art from earlier runs keyed by (font, columns), plus the column
+    # buckets it covers, most recently used last
+    try:
+        with open(TITLE_CACHE_PATH, "rb") as f:
+            data = pickle.load(f)
+        if data.get("key") == _title_cache_key():
+            return dict(data["art"]), list(data["widths"])
+    except Exception:
+        pass
+    return {}, []
+
+
+def save_title_cache(art: Dict[Tuple[str, int], str], widths: List[int]) -> None:
+    # Keep only the most recently used column buckets so the file stays bounded
+    widths = widths[-TITLE_CACHE_MAX_WIDTHS:]
+    keep = set(widths)
+    art = {k: v for k, v in art.items() if k[1] in keep}
+    try:
+        os.makedirs(os.path.dirname(TITLE_CACHE_PATH), exist_ok=True)
+        tmp_path = TITLE_CACHE_PATH + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": _title_cache_key(), "widths": widths, "art": art}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, TITLE_CACHE_PATH)
+    except Exception:
+        # The cache is only a startup speedup; never fail the app over it
+        pass
+
+
+_line_spacing_cache: Dict[str, int] = {}
+
+
+def line_spacing(font: QtGui.QFont) -> int:
+    # QFontMetrics is costly to build; the answer only depends on the font itself
+    key = font.key()
+    spacing = _line_spacing_cache.get(key)
+    if spacing is None:
+        spacing = _line_spacing_cache[key] = QtGui.QFontMetrics(font).lineSpacing()
+    return spacing
 
 
 class GlassCard(QtWidgets.QFrame):
@@ -110,7 +169,138 @@ class PowderArrowStyle(QtWidgets.QProxyStyle):
         super().drawPrimitive(element, option, painter, widget)
 
 
+class FigletRenderThread(QtCore.QThread):
+    """Renders figlet art off the GUI thread; restartable with new font/width."""
+
+    rendered = QtCore.Signal(str, int, str)  # font, width, art
+
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.font_name = "standard"
+        self.width = 80
+
+    def run(self) -> None:
+        try:
+            fig = make_figlet(self.font_name, self.width, "center")
+            art = fig.renderText(self.text)
+        except Exception:
+            art = self.text
+        self.rendered.emit(self.font_name, self.width, art)
+
+
+class ArtPrerenderThread(QtCore.QThread):
+    """Renders the title in every font at one width, in the order of ``fonts``."""
+
+    rendered = QtCore.Signal(str, int, str)  # font, width, art
+
+    def __init__(self, text: str, fonts: Tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.fonts = fonts
+        self.width = 80
+        self.skip: frozenset = frozenset()
+        self.completed = False  # set once a sweep finishes without interruption
+
+    def run(self) -> None:
+        self.completed = False
+        for font in self.fonts:
+            if self.isInterruptionRequested():
+                return
+            if font in self.skip:
+                continue
+            try:
+                # Bypass make_figlet so a full sweep doesn't evict its entries
+                art = Figlet(font=font, width=self.width, justify="center").renderText(self.text)
+            except Exception:
+                art = self.text
+            self.rendered.emit(font, self.width, art)
+            # Rendering is pure Python; drop the GIL briefly so the UI thread keeps up
+            self.msleep(2)
+        self.completed = True
+
+
 class FontArtWindow(QtWidgets.QWidget):
+    # Baby blue + pink theme, rounded, glassy controls; built once for all instances
+    _STYLESHEET = """
+    #RootWindow {
+        background: transparent;
+    }
+    QLabel {
+        color: #B0E0E6; /* powder blue */
+        font-weight: 600;
+    }
+
+    #LogoView {
+        color: rgba(35, 35, 35, 235);
+        background: transparent;
+        border-radius: 12px;
+    }
+
+    #InputEdit {
+        padding: 10px 14px;
+        border-radius: 14px;
+        border: 1px solid rgba(255,255,255,216);
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(255, 240, 245, 240),   /* lavenderblush */
+            stop:1 rgba(224, 247, 250, 240)    /* light cyan */
+        );
+        color: #222;
+        selection-background-color: rgba(255,182,193,216);
+    }
+    #InputEdit:focus {
+        border: 1.5px solid rgba(135, 206, 235, 255);
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(255, 228, 235, 255),
+            stop:1 rgba(210, 245, 255, 255)
+        );
+    }
+
+    #FontCombo {
+        padding: 8px 12px;
+        border-radius: 14px;
+        border: 1px solid rgba(255,255,255,216);
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(224, 247, 250, 240),
+            stop:1 rgba(255, 240, 245, 240)
+        );
+        color: #222; /* match input text color */
+    }
+    #FontCombo::drop-down {
+        width: 26px;
+        border: 0px;
+    }
+    #FontCombo QAbstractItemView {
+        background: rgba(255,255,255, 255);
+        border: 1px solid rgba(135,206,235,216);
+        color: #222; /* match input text color */
+        selection-background-color: rgba(255, 182, 193, 240);
+        outline: none;
+    }
+
+    #GenerateButton, #QuitButton {
+        padding: 12px 22px; /* slightly increased padding */
+        border-radius: 18px;
+        border: 1px solid rgba(255,255,255,216);
+        color: #1f2937;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(173, 216, 230, 255),
+            stop:1 rgba(255, 182, 193, 255)
+        );
+    }
+    #GenerateButton:pressed, #QuitButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(173, 216, 230, 240),
+            stop:1 rgba(255, 182, 193, 240)
+        );
+    }
+
+    #FontLabel {
+        padding-left: 0px;
+    }
+    """
+
     def __init__(self):
         super().__init__()
         self.setObjectName("RootWindow")
@@ -210,20 +400,46 @@ class FontArtWindow(QtWidgets.QWidget):
         # Bottom stretch so the cluster stays together above buttons
         card_layout.addStretch(1)
 
-        # Populate fonts
-        self.fonts: List[str] = list_figlet_fonts()
-        self.font_combo.addItems(self.fonts)
+        # Populate fonts with a single model reset rather than one insert per item
+        self.fonts: Tuple[str, ...] = list_figlet_fonts()
+        self.font_model = QtCore.QStringListModel(list(self.fonts), self)
+        self.font_combo.setModel(self.font_model)
         if self.fonts:
             self.font_combo.setCurrentIndex(0)  # ensure not empty
 
         # Figlet instance for rendering
-        self.figlet = Figlet(font=self.fonts[0] if self.fonts else "standard")
+        self._current_font = self.fonts[0] if self.fonts else "standard"
+        self.figlet = make_figlet(self._current_font)
 
         # Connections
         self.generate_btn.clicked.connect(self.on_generate)
         self.font_combo.currentTextChanged.connect(self.on_font_change)
         self.quit_btn.clicked.connect(self.close)
 
+        # Logo art is rendered on a worker thread so pyfiglet never blocks the UI
+        self._logo_thread = FigletRenderThread(APP_TITLE_TEXT, self)
+        self._logo_thread.rendered.connect(self._on_logo_rendered)
+
+        # Rendered title art keyed by (font, columns), seeded from disk and
+        # filled in the background; written back on close if it grew
+        self._art_cache, self._art_widths = load_title_cache()
+        self._art_cache_dirty = False
+        self._prerender_thread = ArtPrerenderThread(APP_TITLE_TEXT, self.fonts, self)
+        self._prerender_thread.rendered.connect(self._cache_art)
+
+        # Debounce timer so a drag-resize triggers one logo refresh, not one per event
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self.refresh_logo)
+
+        # A new column bucket restarts the full sweep only once the size has been
+        # stable for a while, so a drag-resize doesn't keep re-rendering every font
+        self._prerender_timer = QtCore.QTimer(self)
+        self._prerender_timer.setSingleShot(True)
+        self._prerender_timer.setInterval(600)
+        self._prerender_timer.timeout.connect(lambda: self._prerender_logos(self._logo_columns()))
+
         # Timer for rotating logo font every 3 seconds
         self.logo_timer = QtCore.QTimer(self)
         self.logo_timer.setInterval(3000)
@@ -248,107 +464,30 @@ class FontArtWindow(QtWidgets.QWidget):
         # Adjust window width to fit content tightly
         self.adjust_width_to_content()
 
-        # Match heights of the input and dropdown so bottoms are perfectly even
+        # Match heights of the input and dropdown so bottoms are perfectly even;
+        # deferred until the widgets are polished so sizeHint() reflects the stylesheet
         QtCore.QTimer.singleShot(0, self._sync_input_heights)
 
+        # Pre-render the title in every font once the window is on screen
+        QtCore.QTimer.singleShot(0, lambda: self._prerender_logos(self._logo_columns()))
+
         # Make window draggable from the logo or the card background
         self._drag_pos: QtCore.QPoint | None = None
+        # Resolve the Qt 6 / Qt 5 global position accessor once, not per mouse move
+        if hasattr(QtGui.QMouseEvent, "globalPosition"):
+            self._get_global_pos = lambda e: e.globalPosition().toPoint()
+        else:
+            self._get_global_pos = lambda e: e.globalPos()
         self.logo_view.installEventFilter(self)
         self.card.installEventFilter(self)
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
-        # Reflow logo art to fit within fixed logo area when resized
-        QtCore.QTimer.singleShot(0, self.refresh_logo)
+        # Reflow logo art to fit within fixed logo area once resizing settles
+        self._resize_timer.start()
 
     def apply_styles(self):
-        # Baby blue + pink theme, rounded, glassy controls
-        self.setStyleSheet(
-            """
-            #RootWindow {
-                background: transparent;
-            }
-            QLabel {
-                color: #B0E0E6; /* powder blue */
-                font-weight: 600;
-            }
-
-            #LogoView {
-                color: rgba(35, 35, 35, 235);
-                background: transparent;
-                border-radius: 12px;
-            }
-
-            #InputEdit {
-                padding: 10px 14px;
-                border-radius: 14px;
-                border: 1px solid rgba(255,255,255,216);
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(255, 240, 245, 240),   /* lavenderblush */
-                    stop:1 rgba(224, 247, 250, 240)    /* light cyan */
-                );
-                color: #222;
-                selection-background-color: rgba(255,182,193,216);
-            }
-            #InputEdit:focus {
-                border: 1.5px solid rgba(135, 206, 235, 255);
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(255, 228, 235, 255),
-                    stop:1 rgba(210, 245, 255, 255)
-                );
-            }
-
-            #FontCombo {
-                padding: 8px 12px;
-                border-radius: 14px;
-                border: 1px solid rgba(255,255,255,216);
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(224, 247, 250, 240),
-                    stop:1 rgba(255, 240, 245, 240)
-                );
-                color: #222; /* match input text color */
-            }
-            #FontCombo::drop-down {
-                width: 26px;
-                border: 0px;
-            }
-            #FontCombo QAbstractItemView {
-                background: rgba(255,255,255, 255);
-                border: 1px solid rgba(135,206,235,216);
-                color: #222; /* match input text color */
-                selection-background-color: rgba(255, 182, 193, 240);
-                outline: none;
-            }
-
-            #GenerateButton, #QuitButton {
-                padding: 12px 22px; /* slightly increased padding */
-                border-radius: 18px;
-                border: 1px solid rgba(255,255,255,216);
-                color: #1f2937;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(173, 216, 230, 255),
-                    stop:1 rgba(255, 182, 193, 255)
-                );
-            }
-            #GenerateButton:hover, #QuitButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(173, 216, 230, 255),
-                    stop:1 rgba(255, 182, 193, 255)
-                );
-            }
-            #GenerateButton:pressed, #QuitButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(173, 216, 230, 240),
-                    stop:1 rgba(255, 182, 193, 240)
-                );
-            }
-
-            #FontLabel {
-                padding-left: 0px;
-            }
-            """
-        )
+        self.setStyleSheet(self._STYLESHEET)
 
     # --- Logic ---
     def eventFilter(self, source: QtCore.QObject, event: QtCore.QEvent) -> bool:
@@ -357,16 +496,12 @@ class FontArtWindow(QtWidgets.QWidget):
             if event.type() == QtCore.QEvent.MouseButtonPress and isinstance(event, QtGui.QMouseEvent):
                 if event.button() == QtCore.Qt.LeftButton:
                     # Store offset from top-left corner
-                    global_pos = event.globalPosition() if hasattr(event, "globalPosition") else event.globalPos()
-                    if isinstance(global_pos, QtCore.QPointF):
-                        global_pos = global_pos.toPoint()
+                    global_pos = self._get_global_pos(event)
                     self._drag_pos = global_pos - self.frameGeometry().topLeft()
                     return True
             elif event.type() == QtCore.QEvent.MouseMove and isinstance(event, QtGui.QMouseEvent):
                 if self._drag_pos is not None and (event.buttons() & QtCore.Qt.LeftButton):
-                    global_pos = event.globalPosition() if hasattr(event, "globalPosition") else event.globalPos()
-                    if isinstance(global_pos, QtCore.QPointF):
-                        global_pos = global_pos.toPoint()
+                    global_pos = self._get_global_pos(event)
                     self.move(global_pos - self._drag_pos)
                     return True
             elif event.type() == QtCore.QEvent.MouseButtonRelease and isinstance(event, QtGui.QMouseEvent):
@@ -374,32 +509,105 @@ class FontArtWindow(QtWidgets.QWidget):
                     self._drag_pos = None
                     return True
         return super().eventFilter(source, event)
-    def refresh_logo(self):
-        if not self.fonts:
-            return
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Let in-flight logo renders finish before the thread objects are destroyed
+        self.logo_timer.stop()
+        self._prerender_timer.stop()
+        self._prerender_thread.requestInterruption()
+        self._prerender_thread.wait()
+        self._logo_thread.wait()
+        if self._art_cache_dirty:
+            save_title_cache(self._art_cache, self._art_widths)
+        super().closeEvent(event)
+
+    def _logo_columns(self) -> int:
         # Determine character columns that fit in the logo viewport width
         viewport_w = self.logo_view.viewport().width()
         metrics = QtGui.QFontMetrics(self.logo_view.font())
         char_w = max(1, metrics.horizontalAdvance("M"))
         cols = max(40, int((viewport_w - 16) / char_w))
+        # Round down to a multiple of 20 so small resizes reuse cached renderers
+        return cols - cols % 20
+
+    def refresh_logo(self):
+        if not self.fonts:
+            return
+
+        cols = self._logo_columns()
+        if self.isVisible() and self._prerender_thread.width != cols:
+            # Stop the stale sweep now; the new one starts once resizing settles
+            self._prerender_thread.requestInterruption()
+            self._prerender_timer.start()
 
         random_font = random.choice(self.fonts)
+        art = self._art_cache.get((random_font, cols))
+        if art is not None:
+            self._show_logo(art)
+            return
+        # Cache miss: render just this one in the background, unless a render is in flight
+        if self._logo_thread.isRunning():
+            return
+        self._logo_thread.font_name = random_font
+        self._logo_thread.width = cols
+        self._logo_thread.start()
+
+    def _prerender_logos(self, cols: int) -> None:
+        # (Re)start the background sweep unless this bucket is done or still being rendered
+        thread = self._prerender_thread
+        if thread.width == cols and (
+            thread.completed or (thread.isRunning() and not thread.isInterruptionRequested())
+        ):
+            return
+        self._prerender_thread.requestInterruption()
+        self._prerender_thread.wait()
+        self._prerender_thread.width = cols
+        # Track bucket recency so the saved cache keeps the widths actually in use
+        if cols in self._art_widths:
+            self._art_widths.remove(cols)
+        self._art_widths.append(cols)
+        # Fonts already loaded from the on-disk cache need no rendering
+        self._prerender_thread.skip = frozenset(f for f, c in self._art_cache if c == cols)
+        self._prerender_thread.fonts = self._fonts_near(self._current_font)
+        self._prerender_thread.completed = False
+        self._prerender_thread.start(QtCore.QThread.LowPriority)
+
+    def _fonts_near(self, font: str) -> Tuple[str, ...]:
+        # All fonts, ordered outward from the selected one in the list
         try:
-            fig = Figlet(font=random_font, width=cols, justify="center")
-            art = fig.renderText(APP_TITLE_TEXT)
-        except Exception:
-            art = APP_TITLE_TEXT
-
-        # Update content
-        self.logo_view.setPlainText(art)
+            i = self.fonts.index(font)
+        except ValueError:
+            return self.fonts
+        order = sorted(range(len(self.fonts)), key=lambda j: abs(j - i))
+        return tuple(self.fonts[j] for j in order)
+
+    def _cache_art(self, font: str, cols: int, art: str) -> None:
+        self._art_cache[(font, cols)] = art
+        self._art_cache_dirty = True
+
+    def _on_logo_rendered(self, font: str, cols: int, art: str) -> None:
+        self._cache_art(font, cols, art)
+        self._show_logo(art)
+
+    def _show_logo(self, art: str) -> None:
+        # Hold repaints until the text and font size are final; re-enabling
+        # then repaints only the logo view instead of once per intermediate step
+        self.logo_view.setUpdatesEnabled(False)
+        try:
+            # Update content
+            self.logo_view.setPlainText(art)
 
-        # Fit height: reduce font size if needed so title fits above actions
-        self._fit_logo_height(art)
+            # Fit height: reduce font size if needed so title fits above actions
+            self._fit_logo_height(art)
+        finally:
+            self.logo_view.setUpdatesEnabled(True)
 
     def on_font_change(self, font_name: str):
+        if font_name == self._current_font:
+            return
         try:
-            self.figlet.setFont(font=font_name)
+            self.figlet = make_figlet(font_name)
+            self._current_font = font_name
         except Exception:
             # ignore invalid font switches
             pass
@@ -412,7 +620,10 @@ class FontArtWindow(QtWidgets.QWidget):
 
         selected_font = self.font_combo.currentText() or "standard"
         try:
-            self.figlet.setFont(font=selected_font)
+            # The combo signal normally keeps self.figlet in sync already
+            if selected_font != self._current_font:
+                self.figlet = make_figlet(selected_font)
+                self._current_font = selected_font
             art = self.figlet.renderText(text)
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "Render failed", f"Could not render text with font '{selected_font}'.\n{e}")
@@ -443,17 +654,15 @@ class FontArtWindow(QtWidgets.QWidget):
         # Keep the logo area height fixed; only adjust font size down to fit
         max_h = max(60, self.logo_view.height() - 4)
         f = self.logo_view.font()
-        pt = f.pointSize() if f.pointSize() > 0 else 10
-        metrics = QtGui.QFontMetrics(f)
+        pt = start_pt = f.pointSize() if f.pointSize() > 0 else 10
 
-        lines = art.splitlines() or [""]
-        req_h = len(lines) * metrics.lineSpacing()
-        while req_h > max_h and pt > 7:
+        # Count lines without building a list (a trailing newline ends the last line)
+        n_lines = max(1, art.count("\n") + (not art.endswith("\n")))
+        while n_lines * line_spacing(f) > max_h and pt > 7:
             pt -= 1
             f.setPointSize(pt)
+        if pt != start_pt:
             self.logo_view.setFont(f)
-            metrics = QtGui.QFontMetrics(f)
-            req_h = len(lines) * metrics.lineSpacing()
         # Do not change widget height; positions of other items remain constant
 
     def _sync_input_heights(self) -> None:
@@ -1,4 +1,6 @@
 import sys
+import re
+from xml.sax.saxutils import escape
 from PySide6.QtWidgets import QApplication, QWidget, QPushButton, QVBoxLayout, QFileDialog, QMessageBox
 from PySide6.QtCore import Qt
 import pypandoc
@@ -41,23 +43,20 @@ class MarkdownConverter(QWidget):
 
     def convert_to_text(self, md_path, output_path):
         try:
-            with open(md_path, "r", encoding="utf-8") as f:
-                md_content = f.read()
-            output = pypandoc.convert_text(md_content, 'plain', format='md', extra_args=['--standalone'])
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(output)
+            # Let pandoc read the source and write the result itself
+            pypandoc.convert_file(md_path, 'plain', format='md', outputfile=output_path, extra_args=['--standalone'])
             QMessageBox.information(self, "Success", "Markdown converted to Text successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to convert: {e}")
 
     def convert_to_pdf(self, md_path, output_path):
         try:
-            with open(md_path, "r", encoding="utf-8") as f:
-                md_content = f.read()
-            text = pypandoc.convert_text(md_content, 'plain', format='md', extra_args=['--standalone'])
+            text = pypandoc.convert_file(md_path, 'plain', format='md', extra_args=['--standalone'])
             doc = SimpleDocTemplate(output_path)
-            styles = getSampleStyleSheet()
-            story = [Paragraph(line, styles["Normal"]) for line in text.split("\n")]
+            normal = getSampleStyleSheet()["Normal"]
+            # One Paragraph per blank-line separated block, keeping line breaks
+            blocks = re.split(r"\n\s*\n", escape(text))
+            story = [Paragraph(block.replace("\n", "<br/>"), normal) for block in blocks if block.strip()]
             doc.build(story)
             QMessageBox.information(self, "Success", "Markdown converted to PDF successfully!")
         except Exception as e:
@@ -57,26 +57,32 @@ class IconConverterApp(QWidget):
             return
 
         try:
+            # Get selected sizes
+            selected_sizes = [self.sizes[i] for i, cb in enumerate(self.checkboxes) if cb.isChecked()]
+            if not selected_sizes:
+                QMessageBox.warning(self, "No Sizes Selected", "Please select at least one icon size.")
+                return
+
+            wants_icns = any(s in [16, 32, 128, 256, 512] for s in selected_sizes)
+
             # Load image (handle SVG if needed)
             if img_file.lower().endswith('.svg'):
                 import cairosvg  # Ensure cairosvg is in local scope
                 if not self.svg_support:
                     QMessageBox.critical(self, "Error", "SVG support requires cairosvg. Please install it.")
                     return
-                # Convert SVG to PNG in memory
-                png_bytes = cairosvg.svg2png(url=img_file)
+                # Rasterize once at the largest size any output needs so nothing gets
+                # upscaled; the ICNS always carries slots up to 1024 px
+                max_size = max(selected_sizes)
+                if wants_icns:
+                    max_size = max(max_size, 1024)
+                png_bytes = cairosvg.svg2png(url=img_file, output_width=max_size, output_height=max_size)
                 if png_bytes is None:
                     raise ValueError("SVG conversion failed.")
                 img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
             else:
                 img = Image.open(img_file).convert("RGBA")
 
-            # Get selected sizes
-            selected_sizes = [self.sizes[i] for i, cb in enumerate(self.checkboxes) if cb.isChecked()]
-            if not selected_sizes:
-                QMessageBox.warning(self, "No Sizes Selected", "Please select at least one icon size.")
-                return
-
             # Windows ICO
             ico_path = os.path.join(save_dir, "icon.ico")
             ico_sizes = [(s, s) for s in selected_sizes if s in [16, 32, 48, 256]]
@@ -85,15 +91,19 @@ class IconConverterApp(QWidget):
 
             # macOS ICNS
             icns_path = os.path.join(save_dir, "icon.icns")
-            if any(s in [16, 32, 128, 256, 512] for s in selected_sizes):
+            if wants_icns:
                 img.save(icns_path, format="ICNS")
 
             # Linux PNG sizes
             linux_dir = os.path.join(save_dir, "linux_icons")
             os.makedirs(linux_dir, exist_ok=True)
-            for size in selected_sizes:
-                resized = img.resize((size, size), LANCZOS_RESAMPLE)
-                resized.save(os.path.join(linux_dir, f"icon_{size}x{size}.png"))
+            # Resize largest-first, each level from the previous one, so
+            # small sizes don't filter the full-resolution source again.
+            # Premultiply alpha once up front instead of inside every resize.
+            current = img.convert("RGBa")
+            for size in sorted(selected_sizes, reverse=True):
+                current = current.resize((size, size), LANCZOS_RESAMPLE)
+                current.convert("RGBA").save(os.path.join(linux_dir, f"icon_{size}x{size}.png"))
 
             QMessageBox.information(self, "Success", f"Icons saved in:\n{save_dir}")
 
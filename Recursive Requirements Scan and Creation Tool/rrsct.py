@@ -2,7 +2,10 @@ import sys
 import os
 import sysconfig
 import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 from packaging.version import parse as parse_version, InvalidVersion
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog,
@@ -13,7 +16,24 @@ from PySide6.QtCore import Qt, QThread, Signal
 
 # -------------------- HELPERS --------------------
 
+PYPI_WORKERS = 16
+REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9_.\-]+)\s*([=<>!~]*.*)?$")
+PACKAGE_NAME_RE = re.compile(r"[A-Za-z0-9_.\-]+")
+IMPORT_RE = re.compile(rb"(?m)^\s*(?:from|import)\s+([A-Za-z_][\w.]*)")
+IMPORT_SCAN_BYTES = 4096
+
+
+@lru_cache(maxsize=4096)
+def _pv(version):
+    return parse_version(version)
+
+
 def get_standard_libs():
+    # Python 3.10+ ships the list; only older interpreters need the walk
+    return set(getattr(sys, "stdlib_module_names", ())) or _walk_standard_libs()
+
+
+def _walk_standard_libs():
     std_lib = sysconfig.get_paths()["stdlib"]
     std_libs = set()
     for root, _, files in os.walk(std_lib):
@@ -27,14 +47,13 @@ def get_standard_libs():
 
 def clean_and_merge_requirements(reqs, log_fn):
     clean_reqs = {}
-    pattern = re.compile(r"^([A-Za-z0-9_.\-]+)\s*([=<>!~]*.*)?$")
 
     for r in reqs:
         r = r.strip()
         if not r or r.startswith("#") or "@ file://" in r:
             continue
 
-        match = pattern.match(r)
+        match = REQUIREMENT_RE.match(r)
         if not match:
             log_fn(f"Skipping invalid line: {r}")
             continue
@@ -49,7 +68,9 @@ def clean_and_merge_requirements(reqs, log_fn):
                 if "==" in spec:
                     new_ver = spec.split("==")[-1]
                     old_ver = old_spec.split("==")[-1] if "==" in old_spec else ""
-                    if not old_ver or parse_version(new_ver) > parse_version(old_ver):
+                    if new_ver == old_ver:
+                        continue
+                    if not old_ver or _pv(new_ver) > _pv(old_ver):
                         clean_reqs[pkg] = spec
                 else:
                     clean_reqs[pkg] = old_spec or spec
@@ -63,30 +84,58 @@ def clean_and_merge_requirements(reqs, log_fn):
 
 
 def validate_on_pypi(requirements, log_fn):
-    valid_reqs = []
-    for line in requirements:
-        pkg = re.split(r"[=<>!~]", line)[0].strip()
-        url = f"https://pypi.org/pypi/{pkg}/json"
-        try:
-            resp = requests.get(url, timeout=2)
-            if resp.status_code == 200:
-                valid_reqs.append(line)
-            else:
-                log_fn(f"Package not on PyPI: {pkg}")
-        except Exception:
-            log_fn(f"Could not validate package: {pkg}")
-    return valid_reqs
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=PYPI_WORKERS, pool_maxsize=PYPI_WORKERS)
+    session.mount("https://", adapter)
+
+    futures = {}
+    with session, ThreadPoolExecutor(max_workers=PYPI_WORKERS) as executor:
+        for line in requirements:
+            match = PACKAGE_NAME_RE.match(line)
+            pkg = match.group(0) if match else line.strip()
+            url = f"https://pypi.org/pypi/{pkg}/json"
+            future = executor.submit(session.head, url, timeout=3, allow_redirects=True)
+            futures[future] = (line, pkg)
+
+        valid = set()
+        for future in as_completed(futures):
+            line, pkg = futures[future]
+            try:
+                if future.result().status_code in (200, 301, 302):
+                    valid.add(line)
+                else:
+                    log_fn(f"Package not on PyPI: {pkg}")
+            except Exception:
+                log_fn(f"Could not validate package: {pkg}")
 
+    # Keep the sorted order produced by clean_and_merge_requirements
+    return [line for line in requirements if line in valid]
 
-def safe_read_file(file_path, log_fn):
-    for enc in ["utf-8-sig", "utf-8", "latin-1"]:
+
+def iter_source_files(root):
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
         try:
-            with open(file_path, "r", encoding=enc, errors="ignore") as f:
-                return f.readlines()
-        except Exception:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_source_files(entry.path)
+            elif entry.name.endswith(".py") or entry.name == "requirements.txt":
+                yield entry.path
+        except OSError:
             continue
-    log_fn(f"Could not read file: {file_path}")
-    return []
+
+
+def safe_read_file(file_path, log_fn):
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        log_fn(f"Could not read file: {file_path}")
+        return []
+    return data.decode("utf-8-sig", errors="replace").splitlines()
 
 
 # -------------------- WORKER THREAD --------------------
@@ -107,11 +156,7 @@ class Worker(QThread):
 
     def run(self):
         requirements = set()
-        all_files = []
-        for root, _, files in os.walk(self.source_dir):
-            for file in files:
-                if file.endswith(".py") or file == "requirements.txt":
-                    all_files.append(os.path.join(root, file))
+        all_files = list(iter_source_files(self.source_dir))
 
         total_files = len(all_files)
         for idx, file_path in enumerate(all_files):
@@ -130,17 +175,18 @@ class Worker(QThread):
         self.finished.emit(validated)
 
     def process_python_file(self, file_path, requirements):
-        lines = safe_read_file(file_path, self.log)
-        for i, line in enumerate(lines):
-            if i >= 50:
-                break
-            line = line.strip()
-            if line.startswith("import "):
-                pkg = line.split()[1].split(".")[0]
-                requirements.add(pkg)
-            elif line.startswith("from "):
-                pkg = line.split()[1].split(".")[0]
-                requirements.add(pkg)
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(IMPORT_SCAN_BYTES)
+        except OSError:
+            self.log(f"Could not read file: {file_path}")
+            return
+        if len(head) == IMPORT_SCAN_BYTES:
+            # The read may stop mid-line ("import reque"), so drop the partial last line
+            head = head[:head.rfind(b"\n") + 1]
+        requirements.update(
+            m.split(b".")[0].decode("ascii", "ignore") for m in IMPORT_RE.findall(head)
+        )
 
     def process_requirements_file(self, file_path, requirements):
         lines = safe_read_file(file_path, self.log)
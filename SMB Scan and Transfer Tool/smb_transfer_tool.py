@@ -11,7 +11,7 @@ Feature set (robust, end-to-end):
   Copy →, ← Copy, Delete Selected, Rename, New Folder
 - Checkboxes on both panes + multi-select
 - Recursive copy with **resume** (size- and partial-file aware)
-- Optional **MD5 verification** (toggle)
+- Optional **content verification** (BLAKE3 if installed, else SHA-256; toggle)
 - Threaded transfers with per-file and overall progress + cancellable
 - Detailed status and log panel; persistent log at ~/Library/Logs/SimpleSMBExplorer.log
 - Auth prompt with optional **save credentials to macOS Keychain** (`keyring`)
@@ -22,32 +22,40 @@ Tested with: Python 3.10+, PySide6 6.6+, macOS 12+
 
 Install:
   pip install PySide6 zeroconf keyring
-(Optional): pip install psutil
+(Optional): pip install psutil blake3
 
 NOTE:
 - Uses macOS tools: `smbutil`, `mount_smbfs`, `diskutil`.
-- MD5 on huge files can be slow; disable if needed.
+- Verifying huge files re-reads the destination; disable if needed.
 - Resume will append from destination size if smaller than source.
 """
 from __future__ import annotations
+import atexit
 import os
 import sys
 import re
+import ctypes
+import errno
+import functools
 import hashlib
+import mmap
+import queue
 import shutil
 import subprocess
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, Signal, Slot, QThread
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTreeView, QSplitter, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QCheckBox, QProgressBar, QComboBox, QInputDialog,
-    QMessageBox, QFileDialog, QStatusBar, QTextEdit
+    QMessageBox, QFileDialog, QStatusBar, QPlainTextEdit
 )
 
 try:
@@ -56,7 +64,7 @@ except Exception:
     keyring = None
 
 try:
-    from zeroconf import ServiceBrowser, Zeroconf
+    from zeroconf import ServiceBrowser, ServiceStateChange, Zeroconf
 except Exception:
     Zeroconf = None
 
@@ -65,30 +73,81 @@ try:
 except Exception:
     psutil = None
 
+try:
+    import fcntl
+except Exception:
+    fcntl = None
+
+# Digest used for transfer verification: BLAKE3 is SIMD-accelerated, SHA-256
+# uses the CPU's SHA extensions through OpenSSL; both outrun MD5
+try:
+    from blake3 import blake3 as new_hash
+except Exception:
+    new_hash = hashlib.sha256
+
 LOG_DIR = Path.home() / "Library/Logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = LOG_DIR / "SimpleSMBExplorer.log"
 SERVICE_NAME = "SimpleSMBExplorer"
+LOG_VIEW_LINES = 2000  # lines kept in the log panel
+COPY_WORKERS = 4       # files copied concurrently per transfer
 
 # --------------------------- Utilities ---------------------------
 
+# `smbutil view` share line: \\host\share  Disk ...
+_SMB_SHARE_RE = re.compile(r"^\\\\[^\\]+\\([^\s]+)\s+")
+
+_LOG_Q: "queue.Queue[Optional[str]]" = queue.Queue()
+
+
+def _log_writer():
+    # Single writer keeps the log open and writes whatever queued up in one go
+    f = None
+    while True:
+        batch = [_LOG_Q.get()]
+        while True:
+            try:
+                batch.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if f is None:
+                f = LOG_FILE.open("a", encoding="utf-8")
+            f.write("".join(line for line in batch if line is not None))
+            f.flush()
+        except Exception:
+            pass
+        if None in batch:
+            if f is not None:
+                f.close()
+            return
+
+
+_LOG_THREAD = threading.Thread(target=_log_writer, name="log-writer", daemon=True)
+_LOG_THREAD.start()
+
+
+@atexit.register
+def _drain_log():
+    _LOG_Q.put(None)
+    _LOG_THREAD.join(timeout=2)
+
+
 def log(msg: str):
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {msg}\n"
-    try:
-        with LOG_FILE.open("a", encoding="utf-8") as f:
-            f.write(line)
-    except Exception:
-        pass
+    _LOG_Q.put(line)
     print(line, end="")
 
 
 def run(cmd: List[str], timeout: int = 30) -> Tuple[int, str, str]:
     log(f"RUN: {' '.join(cmd)}")
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        out = p.stdout.strip()
-        err = p.stderr.strip()
+        # No stdin so a tool can never sit waiting on a prompt; decode bytes ourselves
+        # (UTF-8, lenient) rather than text mode's locale decoding, which can raise
+        p = subprocess.run(cmd, capture_output=True, timeout=timeout, stdin=subprocess.DEVNULL)
+        out = p.stdout.decode("utf-8", "replace").strip() if p.stdout else ""
+        err = p.stderr.decode("utf-8", "replace").strip() if p.stderr else ""
         if p.returncode != 0:
             log(f"ERR({p.returncode}): {err}")
         else:
@@ -100,17 +159,142 @@ def run(cmd: List[str], timeout: int = 30) -> Tuple[int, str, str]:
         return 1, "", str(e)
 
 
-def md5sum(path: Path, chunk: int = 2**20, start_offset: int = 0) -> str:
-    h = hashlib.md5()
+def file_digest(path: Path, chunk: int = 2**20, start_offset: int = 0) -> str:
+    h = new_hash()
+    hash_file_into(h, path, chunk, start_offset)
+    return h.hexdigest()
+
+
+def on_share(path: Path) -> bool:
+    """True for paths under /Volumes, where mounted SMB shares live (see MainWindow)."""
+    return str(path.absolute()).startswith("/Volumes/")
+
+
+def hash_file_into(h, path: Path, chunk: int = 2**20, start_offset: int = 0, end: Optional[int] = None) -> None:
+    """Feed bytes [start_offset, end) of path into the hash object h."""
     with path.open("rb") as f:
+        # Local files: hash a read-only mapping in a single update (no Python read loop).
+        # Never map files on a share: if it drops or the file shrinks mid-hash, touching
+        # the mapping raises SIGBUS and kills the app, where read() raises OSError.
+        # Empty and special files can't be mapped and use the loop below.
+        if not on_share(path):
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view, view[start_offset:end] as part:
+                        h.update(part)
+                return
+            except (OSError, ValueError):
+                pass
         if start_offset:
             f.seek(start_offset)
-        while True:
-            b = f.read(chunk)
-            if not b:
+        remaining = None if end is None else max(0, end - start_offset)
+        buf = memoryview(bytearray(chunk))
+        while remaining is None or remaining > 0:
+            n = f.readinto(buf if remaining is None or remaining >= chunk else buf[:remaining])
+            if not n:
                 break
-            h.update(b)
-    return h.hexdigest()
+            h.update(buf[:n])
+            if remaining is not None:
+                remaining -= n
+
+
+@functools.lru_cache(maxsize=1)
+def _darwin_clonefile():
+    try:
+        fn = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True).clonefile
+        fn.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+        fn.restype = ctypes.c_int
+        return fn
+    except Exception:
+        return None
+
+
+COPYFILE_DATA = 1 << 3  # from <copyfile.h>
+
+
+@functools.lru_cache(maxsize=1)
+def _darwin_fcopyfile():
+    try:
+        fn = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True).fcopyfile
+        fn.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32]
+        fn.restype = ctypes.c_int
+        return fn
+    except Exception:
+        return None
+
+
+def try_clone(src: Path, dst: Path) -> bool:
+    """Create dst as an APFS clone of src (macOS only); the clone shares src's
+    blocks, so its content is identical by construction. Returns False otherwise."""
+    if sys.platform != "darwin":
+        return False
+    clonefile = _darwin_clonefile()
+    return clonefile is not None and clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def try_copy_file_range(src: Path, dst: Path, size: int) -> bool:
+    """Create dst with copy_file_range (Linux): a reflink on XFS/Btrfs, otherwise
+    an in-kernel data copy. Returns False, leaving no dst behind, when it can't."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    remaining = size
+    try:
+        with src.open("rb") as fsrc, dst.open("wb") as fdst:
+            while remaining > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not n:
+                    break
+                remaining -= n
+    except OSError:
+        remaining = -1
+    if remaining:
+        dst.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def advise_sequential(fd: int) -> None:
+    """Ask the OS for aggressive readahead on a file we are about to stream."""
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        elif fcntl is not None and sys.platform == "darwin":
+            fcntl.fcntl(fd, getattr(fcntl, "F_RDAHEAD", 45), 1)
+    except OSError:
+        pass
+
+
+def advise_done(fd: int) -> None:
+    """Drop a streamed file's pages from the cache; we won't read them again."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def walk_files(base: Path) -> Iterator[Tuple[Path, int]]:
+    """Yield (path, size) for every file under base using one scandir pass per directory."""
+    stack = [str(base)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        # Same as os.walk: symlinked folders are neither entered nor
+                        # copied, symlinked files are copied as the file they point to
+                        if e.is_dir():
+                            if not e.is_symlink():
+                                stack.append(e.path)
+                        else:
+                            yield Path(e.path), e.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 def human(n: int) -> str:
@@ -178,10 +362,12 @@ class ZeroconfBrowser(QtCore.QObject):
             pass
 
     def _handler(self, zc, type_, name, state_change):
-        host = name.split(".")[0]
-        if "Added" in str(state_change):
+        # Runs on the zeroconf thread: compare enum members, no string work
+        if state_change is ServiceStateChange.Added:
+            host = name.split(".")[0]
             self.serviceFound.emit(SMBService(host=host, address=host, port=445))
-        elif "Removed" in str(state_change):
+        elif state_change is ServiceStateChange.Removed:
+            host = name.split(".")[0]
             self.serviceRemoved.emit(SMBService(host=host, address=host, port=445))
 
 # --------------------------- Checkable FS Model ---------------------------
@@ -189,6 +375,7 @@ class ZeroconfBrowser(QtCore.QObject):
 class CheckableFSModel(QtWidgets.QFileSystemModel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Keyed by path so checks survive rows being removed and re-inserted
         self._checked: Dict[str, Qt.CheckState] = {}
         self.setOption(QtWidgets.QFileSystemModel.DontUseCustomDirectoryIcons, True)
 
@@ -200,58 +387,90 @@ class CheckableFSModel(QtWidgets.QFileSystemModel):
 
     def data(self, index, role=Qt.DisplayRole):
         if role == Qt.CheckStateRole and index.column() == 0:
-            path = self.filePath(index)
-            return self._checked.get(path, Qt.Unchecked)
+            # Nothing checked (the usual case while painting): skip building a path
+            if not self._checked:
+                return Qt.Unchecked
+            return self._checked.get(self.filePath(index), Qt.Unchecked)
         return super().data(index, role)
 
     def setData(self, index, value, role=Qt.EditRole):
         if role == Qt.CheckStateRole and index.column() == 0:
             path = self.filePath(index)
-            self._checked[path] = Qt.CheckState(value)
+            state = Qt.CheckState(value)
+            if state == Qt.Unchecked:
+                # Only checked items are stored, so the dict never accumulates history
+                self._checked.pop(path, None)
+            else:
+                if state == Qt.Checked and self.isDir(index):
+                    self._drop_descendants(path)
+                self._checked[path] = state
             self.dataChanged.emit(index, index, [Qt.CheckStateRole])
             return True
         return super().setData(index, value, role)
 
+    def _drop_descendants(self, folder: str) -> None:
+        # A checked folder already implies everything below it
+        prefix = folder.rstrip("/") + "/"
+        for path in [p for p in self._checked if p.startswith(prefix)]:
+            del self._checked[path]
+            idx = self.index(path)
+            if idx.isValid():
+                self.dataChanged.emit(idx, idx, [Qt.CheckStateRole])
+
     def checked_paths(self) -> List[Path]:
         return [Path(p) for p, state in self._checked.items() if state == Qt.Checked]
 
 # --------------------------- Transfer Worker ---------------------------
 
+def unique_dest_name(name: str, taken: Set[str], keep_suffix: bool = True) -> str:
+    """Return name, or "stem (N).ext" if it's already in taken; records the result.
+    Names compare case-insensitively, as they do on SMB shares."""
+    stem, ext = (Path(name).stem, Path(name).suffix) if keep_suffix else (name, "")
+    candidate, n = name, 2
+    while candidate.casefold() in taken:
+        candidate = f"{stem} ({n}){ext}"
+        n += 1
+    taken.add(candidate.casefold())
+    return candidate
+
+
 class TransferWorker(QtCore.QObject):
     progress = Signal(int)              # overall percent
-    itemProgress = Signal(str, int)     # path, percent
+    itemProgress = Signal(str, int)     # file name, percent
     status = Signal(str)                # human-readable status
     finished = Signal(bool)             # ok flag
     totals = Signal(int, int)           # total files, total bytes
 
-    def __init__(self, sources: List[Path], dest_dir: Path, verify_md5: bool):
+    def __init__(self, sources: List[Path], dest_dir: Path, verify: bool):
         super().__init__()
         self.sources = sources
         self.dest_dir = dest_dir
-        self.verify_md5 = verify_md5
-        self._stop = False
+        self.verify = verify
+        self._stop = threading.Event()
 
     @Slot()
     def run(self):
         try:
             plan: List[Tuple[Path, Path]] = []
             total_bytes = 0
+            # Copies run in parallel, so no two sources may land on the same destination:
+            # skip repeated sources and give clashing names a " (2)"-style suffix
+            seen_sources = set()
+            taken_names = set()
             for src in self.sources:
+                if src in seen_sources:
+                    continue
+                seen_sources.add(src)
+                name = unique_dest_name(src.name, taken_names, keep_suffix=not src.is_dir())
+                if name != src.name:
+                    self.status.emit(f"{src.name} already in transfer, copying {src} as {name}")
                 if src.is_dir():
-                    base = src
-                    for root, _, files in os.walk(src):
-                        root_p = Path(root)
-                        for fn in files:
-                            s = root_p / fn
-                            rel = s.relative_to(base)
-                            d = self.dest_dir / base.name / rel
-                            plan.append((s, d))
-                            try:
-                                total_bytes += s.stat().st_size
-                            except Exception:
-                                pass
+                    dest_base = self.dest_dir / name
+                    for s, size in walk_files(src):
+                        plan.append((s, dest_base / s.relative_to(src)))
+                        total_bytes += size
                 else:
-                    d = self.dest_dir / src.name
+                    d = self.dest_dir / name
                     plan.append((src, d))
                     try:
                         total_bytes += src.stat().st_size
@@ -260,22 +479,25 @@ class TransferWorker(QtCore.QObject):
 
             self.totals.emit(len(plan), total_bytes)
 
+            # Keep several files in flight so SMB/SSD queues stay busy
             copied_bytes = 0
-            for idx, (src, dst) in enumerate(plan, 1):
-                if self._stop:
-                    raise RuntimeError("Transfer cancelled")
-                self.status.emit(f"Copying {src} → {dst}")
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                copied_bytes += self._copy_with_resume(src, dst)
-                self.itemProgress.emit(str(src), 100)
-                if self.verify_md5 and src.is_file():
-                    sm = md5sum(src)
-                    dm = md5sum(dst)
-                    if sm != dm:
-                        log(f"MD5 mismatch: {src} vs {dst}")
-                        raise RuntimeError(f"MD5 mismatch for {src}")
-                # Update overall progress conservatively
-                self.progress.emit(int(min(99, (copied_bytes * 100) / max(1, total_bytes))))
+            last_pct = -1
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+                futs = [ex.submit(self._copy_one, src, dst) for src, dst in plan]
+                try:
+                    for fut in as_completed(futs):
+                        copied_bytes += fut.result()
+                        # Update overall progress conservatively, and only when the percent moves
+                        pct = int(min(99, (copied_bytes * 100) / max(1, total_bytes)))
+                        if pct != last_pct:
+                            self.progress.emit(pct)
+                            last_pct = pct
+                except BaseException:
+                    # First failure or cancel: drop queued copies, let running ones bail
+                    self._stop.set()
+                    for f in futs:
+                        f.cancel()
+                    raise
 
             self.status.emit("Transfer complete")
             self.progress.emit(100)
@@ -285,32 +507,117 @@ class TransferWorker(QtCore.QObject):
             self.finished.emit(False)
 
     def stop(self):
-        self._stop = True
+        self._stop.set()
+
+    def _copy_one(self, src: Path, dst: Path) -> int:
+        """Copy (and optionally verify) one planned file; runs on the copy pool."""
+        if self._stop.is_set():
+            raise RuntimeError("Transfer cancelled")
+        self.status.emit(f"Copying {src} → {dst}")
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        written, sm = self._copy_with_resume(src, dst)
+        self.itemProgress.emit(src.name, 100)
+        if self.verify and sm is not None and src.is_file():
+            # Source was hashed while copying; only the destination is re-read
+            dm = file_digest(dst)
+            if sm != dm:
+                log(f"Content mismatch: {src} vs {dst}")
+                raise RuntimeError(f"Content mismatch for {src}")
+        return written
 
-    def _copy_with_resume(self, src: Path, dst: Path, chunk: int = 2**20) -> int:
-        """Resume if dst smaller than src; returns bytes written this invocation."""
+    def _copy_with_resume(self, src: Path, dst: Path, chunk: Optional[int] = None) -> Tuple[int, Optional[str]]:
+        """Resume if dst smaller than src; returns (bytes written this invocation, digest of
+        the copied content, "" when verification is off, or None for a filesystem clone)."""
         if src.is_dir():
             dst.mkdir(parents=True, exist_ok=True)
-            return 0
-        s = src.stat().st_size
+            return 0, ""
+        st = src.stat()
+        s = st.st_size
+        if not dst.exists() and st.st_dev == dst.parent.stat().st_dev:
+            if try_clone(src, dst):
+                # True clone: shares the source's blocks, nothing to verify
+                return s, None
+            if try_copy_file_range(src, dst, s):
+                # May have been a real data copy, so it is verified like any other
+                return s, file_digest(src) if self.verify else ""
+        if chunk is None:
+            # Scale like shutil: ~128 reads per file, 64 KiB..16 MiB, never beyond the file
+            chunk = min(max(64 * 1024, s // 128), 16 * 1024 * 1024, max(1, s))
         existing = dst.stat().st_size if dst.exists() else 0
         mode = 'r+b' if dst.exists() else 'wb'
         written = 0
+        h = new_hash() if self.verify else None
         with src.open('rb') as fsrc, open(dst, mode) as fdst:
+            advise_sequential(fsrc.fileno())
             if existing and existing < s:
+                # Seed the hash with the source prefix, so the final compare against
+                # the destination also catches a corrupt or stale resumed prefix
+                if h is not None:
+                    hash_file_into(h, src, chunk, 0, existing)
                 fsrc.seek(existing)
                 fdst.seek(existing)
             copied = existing
+            name = src.name
+            last_pct, last_t = -1, 0.0
+            if h is None and fsrc.tell() == 0:
+                # Fresh copy with nothing to hash: let the kernel move the bytes.
+                # Whatever it can't do is finished by the loop below.
+                sent = self._kernel_copy(src, fsrc, fdst, s)
+                fsrc.seek(sent)
+                fdst.seek(sent)
+                written = copied = sent
+            # One reusable buffer instead of a new bytes object per chunk
+            mv = memoryview(bytearray(chunk))
             while True:
-                buf = fsrc.read(chunk)
-                if not buf:
+                n = fsrc.readinto(mv)
+                if not n:
                     break
-                fdst.write(buf)
-                written += len(buf)
-                copied += len(buf)
-                pct = int((copied * 100) / max(1, s))
-                self.itemProgress.emit(str(src), pct)
-        return written
+                data = mv[:n]
+                if h is not None:
+                    h.update(data)
+                fdst.write(data)
+                written += n
+                copied += n
+                # Throttle cross-thread signals: only on a new percent, at most every 50 ms
+                pct = (copied * 100) // max(1, s)
+                if pct != last_pct:
+                    now = time.monotonic()
+                    if now - last_t > 0.05:
+                        self.itemProgress.emit(name, pct)
+                        last_pct, last_t = pct, now
+            advise_done(fsrc.fileno())
+        return written, h.hexdigest() if h is not None else ""
+
+    def _kernel_copy(self, src: Path, fsrc, fdst, size: int) -> int:
+        """Copy a fresh file without bouncing it through Python: fcopyfile on macOS
+        (works across volumes, e.g. onto an SMB mount), sendfile elsewhere.
+        Returns bytes copied; 0 means nothing usable was written."""
+        if sys.platform == "darwin":
+            fcopyfile = _darwin_fcopyfile()
+            if fcopyfile is not None and fcopyfile(fsrc.fileno(), fdst.fileno(), None, COPYFILE_DATA) == 0:
+                return size
+            return 0
+        if hasattr(os, "sendfile"):
+            return self._sendfile_copy(src, fsrc, fdst, size)
+        return 0
+
+    def _sendfile_copy(self, src: Path, fsrc, fdst, size: int) -> int:
+        """Copy with os.sendfile from offset 0; returns bytes copied before it stopped."""
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        offset = 0
+        while offset < size:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, min(2**30, size - offset))
+            except OSError as e:
+                # Unsupported for this pair of files (e.g. macOS needs a socket as output)
+                if e.errno in (errno.EINVAL, errno.ENOTSUP, errno.ENOTSOCK, errno.EXDEV, errno.ENOSYS):
+                    return offset
+                raise
+            if not sent:
+                break
+            offset += sent
+            self.itemProgress.emit(src.name, int((offset * 100) / max(1, size)))
+        return offset
 
 # --------------------------- Main Window ---------------------------
 
@@ -345,14 +652,14 @@ class MainWindow(QMainWindow):
         opts_h = QHBoxLayout()
         self.progress = QProgressBar(); self.progress.setValue(0)
         self.item_label = QLabel("")
-        self.verify_md5_cb = QCheckBox("MD5 verify")
-        self.verify_md5_cb.setChecked(True)
+        self.verify_cb = QCheckBox("Content verify")
+        self.verify_cb.setChecked(True)
         self.cancel_btn = QPushButton("Cancel Transfer")
         self.cancel_btn.setEnabled(False)
         opts_h.addWidget(QLabel("Progress:")); opts_h.addWidget(self.progress, 4)
         opts_h.addWidget(self.item_label, 2)
         opts_h.addStretch(1)
-        opts_h.addWidget(self.verify_md5_cb)
+        opts_h.addWidget(self.verify_cb)
         opts_h.addWidget(self.cancel_btn)
         root_v.addLayout(opts_h)
 
@@ -396,8 +703,11 @@ class MainWindow(QMainWindow):
         splitter.setSizes([600, 120, 600])
 
         # Log area
-        self.log_text = QTextEdit(); self.log_text.setReadOnly(True)
+        self.log_text = QPlainTextEdit(); self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_VIEW_LINES)
         root_v.addWidget(self.log_text, 0)
+        self._pending_log: List[str] = []
+        self._pending_status: Optional[str] = None
         self._load_log()
 
         # Signals
@@ -416,6 +726,7 @@ class MainWindow(QMainWindow):
         self.zc_browser = ZeroconfBrowser()
         self.zc_browser.serviceFound.connect(self._on_service_found)
         self.zc_browser.serviceRemoved.connect(self._on_service_removed)
+        self._pending_hosts: List[str] = []
 
         # Transfer state
         self.transfer_thread: Optional[QThread] = None
@@ -425,13 +736,32 @@ class MainWindow(QMainWindow):
     def _load_log(self):
         try:
             if LOG_FILE.exists():
-                self.log_text.setPlainText(LOG_FILE.read_text())
+                # Only the tail fits in the panel anyway
+                with LOG_FILE.open("r", encoding="utf-8", errors="replace") as f:
+                    tail = deque(f, maxlen=LOG_VIEW_LINES)
+                self.log_text.setPlainText("".join(tail))
         except Exception:
             pass
 
     def _append_log(self, text: str):
         log(text)
-        self.log_text.append(text)
+        # Coalesce bursts of status lines into one append per 50 ms
+        if not self._pending_log:
+            QtCore.QTimer.singleShot(50, self._flush_log)
+        self._pending_log.append(text)
+
+    def _flush_log(self):
+        if self._pending_log:
+            self.log_text.appendPlainText("\n".join(self._pending_log))
+            self._pending_log.clear()
+        if self._pending_status is not None:
+            self.statusbar.showMessage(self._pending_status)
+            self._pending_status = None
+
+    def _on_transfer_status(self, text: str):
+        # Per-file status lines arrive in bursts; the status bar only shows the latest
+        self._pending_status = text
+        self._append_log(text)
 
     # ----- Discovery & Shares -----
     def scan_network(self):
@@ -440,17 +770,31 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Zeroconf missing", "Install 'zeroconf' (pip install zeroconf) to enable discovery. You can still type a host manually.")
             return
         self.host_combo.clear()
+        self._pending_hosts.clear()
         self.zc_browser.start()
         self._append_log("Started Zeroconf browsing for _smb._tcp.local")
 
     @Slot(object)
     def _on_service_found(self, svc: SMBService):
-        if self.host_combo.findText(svc.host) < 0:
-            self.host_combo.addItem(svc.host)
-            self._append_log(f"Found SMB host: {svc.host}")
+        # Zeroconf reports hosts in bursts; add them to the combo in one batch
+        if not self._pending_hosts:
+            QtCore.QTimer.singleShot(100, self._flush_hosts)
+        if svc.host not in self._pending_hosts:
+            self._pending_hosts.append(svc.host)
+
+    def _flush_hosts(self):
+        existing = {self.host_combo.itemText(i) for i in range(self.host_combo.count())}
+        new = [h for h in self._pending_hosts if h not in existing]
+        self._pending_hosts.clear()
+        if new:
+            self.host_combo.addItems(new)
+            for h in new:
+                self._append_log(f"Found SMB host: {h}")
 
     @Slot(object)
     def _on_service_removed(self, svc: SMBService):
+        if svc.host in self._pending_hosts:
+            self._pending_hosts.remove(svc.host)
         idx = self.host_combo.findText(svc.host)
         if idx >= 0:
             self.host_combo.removeItem(idx)
@@ -488,8 +832,7 @@ class MainWindow(QMainWindow):
         if rc == 0:
             shares = self._parse_smbutil_view(out)
             self.share_combo.clear()
-            for s in shares:
-                self.share_combo.addItem(s)
+            self.share_combo.addItems(shares)
             self.statusbar.showMessage(f"Found {len(shares)} share(s) on {host}")
             self._append_log(f"Shares on {host}: {shares}")
         else:
@@ -498,7 +841,7 @@ class MainWindow(QMainWindow):
     def _parse_smbutil_view(self, out: str) -> List[str]:
         shares: List[str] = []
         for line in out.splitlines():
-            m = re.match(r"^\\\\[^\\]+\\([^\s]+)\s+", line.strip())
+            m = _SMB_SHARE_RE.match(line.strip())
             if m:
                 shares.append(m.group(1))
                 continue
@@ -528,7 +871,12 @@ class MainWindow(QMainWindow):
                         return True
             except Exception:
                 pass
-        return mount_point.exists() and any(mount_point.iterdir())
+        # A mount point sits on a different device than its parent; comparing
+        # st_dev avoids listing the share over the network
+        try:
+            return os.stat(mount_point).st_dev != os.stat(mount_point.parent).st_dev
+        except OSError:
+            return False
 
     def mount_share(self):
         host = self.host_combo.currentText().strip()
@@ -559,7 +907,7 @@ class MainWindow(QMainWindow):
         if rc == 0:
             self.statusbar.showMessage(f"Mounted at {mount_point}")
             self._append_log(f"Mounted {url} at {mount_point}")
-            self.remote_model.setRootPath(str(mount_point))
+            # The model stays rooted at /Volumes; only the view moves into the share
             self.remote_view.setRootIndex(self.remote_model.index(str(mount_point)))
         else:
             QMessageBox.critical(self, "Mount failed", err or out or "Unknown error")
@@ -572,7 +920,6 @@ class MainWindow(QMainWindow):
             if rc == 0:
                 self.statusbar.showMessage(f"Unmounted {path}")
                 self._append_log(f"Unmounted {path}")
-                self.remote_model.setRootPath(self.remote_root)
                 self.remote_view.setRootIndex(self.remote_model.index(self.remote_root))
             else:
                 QMessageBox.critical(self, "Unmount failed", err or out or "Unknown error")
@@ -612,12 +959,12 @@ class MainWindow(QMainWindow):
         self._start_transfer(sources, dest_root)
 
     def _start_transfer(self, sources: List[Path], dest_dir: Path):
-        worker = TransferWorker(sources, dest_dir, self.verify_md5_cb.isChecked())
+        worker = TransferWorker(sources, dest_dir, self.verify_cb.isChecked())
         thread = QThread()
         worker.moveToThread(thread)
         worker.progress.connect(self.progress.setValue)
-        worker.itemProgress.connect(lambda p, pct: self.item_label.setText(f"{Path(p).name}: {pct}%"))
-        worker.status.connect(lambda s: (self._append_log(s), self.statusbar.showMessage(s)))
+        worker.itemProgress.connect(lambda name, pct: self.item_label.setText(f"{name}: {pct}%"))
+        worker.status.connect(self._on_transfer_status)
         worker.finished.connect(lambda ok: self._on_transfer_finished(ok))
         thread.started.connect(worker.run)
         thread.finished.connect(thread.deleteLater)
@@ -633,6 +980,7 @@ class MainWindow(QMainWindow):
 
     def _on_transfer_finished(self, ok: bool):
         self._append_log(f"Transfer {'OK' if ok else 'FAILED'}")
+        self._pending_status = None  # a queued per-file status must not replace the result
         self.statusbar.showMessage(f"Transfer {'OK' if ok else 'FAILED'}")
         if self.transfer_thread:
             self.transfer_thread.quit()
@@ -17,11 +17,15 @@ class Food(Turtle):   #It refers to dot as food
         self.speed("fastest")
         self.refresh()
 
-    def refresh(self):
-        # Only place food on grid positions
+    def refresh(self, occupied=()):
+        # Only place food on grid positions, rejecting cells the snake occupies
         possible_x = [x for x in range(GRID_MIN, GRID_MAX + 1, GRID_SIZE)]
         possible_y = [y for y in range(GRID_MIN, GRID_MAX + 1, GRID_SIZE)]
-        random_x = random.choice(possible_x)
-        random_y = random.choice(possible_y)
+        for _ in range(100):
+            random_x = random.choice(possible_x)
+            random_y = random.choice(possible_y)
+            if (random_x // GRID_SIZE, random_y // GRID_SIZE) not in occupied:
+                break
         self.goto(random_x, random_y)
+        self.dirty = True
 
@@ -1,6 +1,6 @@
 from turtle import Screen, Turtle
 from food import Food
-from snake import Snake
+from snake import Snake, UP, DOWN, LEFT, RIGHT
 from scoreboard import Scoreboard
 import _tkinter
 import time
@@ -9,7 +9,7 @@ screen = Screen()
 
 from turtle import Screen, Turtle
 from food import Food
-from snake import Snake
+from snake import Snake, UP, DOWN, LEFT, RIGHT
 from scoreboard import Scoreboard
 import _tkinter
 import time
@@ -60,10 +60,16 @@ is_game_over = False
 
 GAME_SPEED = 80
 ANIMATION_SPEED = 80
+RENDER_INTERVAL = 16  # ms between redraws (~60 FPS)
+MAX_CATCH_UP_STEPS = 5  # after a longer stall, resync instead of fast-forwarding
 GRID_SIZE = 20
 PLAY_AREA_LIMIT = 360
 next_direction = None
 
+# --- Loop State ---
+loop_running = False
+last_logic_ts = 0.0
+
 # --- UI Functions ---
 def show_start_screen():
     clear_all_text()
@@ -127,23 +133,27 @@ def handle_q():
     if is_paused:
         screen.bye()
 
+def reset_game_state():
+    # Only mutates game objects; the render tick draws the result in one update
+    global next_direction, GAME_SPEED, ANIMATION_SPEED
+    next_direction = None
+    snake.reset()
+    food.refresh(snake.occupied)
+    scoreboard.lives = 3
+    scoreboard.score = 0
+    scoreboard.update_score()
+    GAME_SPEED = 80
+    ANIMATION_SPEED = 80
+
 def handle_p():
-    global is_game_on, game_started, is_paused, next_direction, scoreboard, snake, food, GAME_SPEED, ANIMATION_SPEED, allow_movement
+    global is_game_on, game_started, is_paused, allow_movement
     if is_paused:
         is_game_on = True
         game_started = True
         is_paused = False
-        next_direction = None
-        pause_turtle.clear()
-        scoreboard.clear()
-        snake.reset()
-        food.refresh()
-        scoreboard.lives = 3
-        scoreboard.score = 0
-        scoreboard.update_score()
-        GAME_SPEED = 80
-        ANIMATION_SPEED = 80
         allow_movement = False
+        reset_game_state()
+        pause_turtle.clear()
         show_bottom_text("SPACE to pause | P for new game | Q to quit")
         show_countdown()
 
@@ -162,18 +172,26 @@ def start_game():
     show_countdown()
 
 # --- Countdown ---
+countdown_token = 0
+
 def show_countdown():
-    global allow_movement
+    # Driven by screen.ontimer so Tk keeps handling input and redraws meanwhile
+    global allow_movement, countdown_token
     allow_movement = False
-    for i in range(3, 0, -1):
-        countdown_turtle.clear()
-        countdown_turtle.write(str(i), align="center", font=("Courier", 64, "bold"))
-        screen.update()
-        time.sleep(1)
+    countdown_token += 1
+    countdown_step(3, countdown_token)
+
+def countdown_step(i, token):
+    global allow_movement
+    if token != countdown_token:
+        return  # a newer countdown (P pressed again) took over
     countdown_turtle.clear()
-    screen.update()
-    allow_movement = True
-    start_snake_game()
+    if i == 0:
+        allow_movement = True
+        start_snake_game()
+        return
+    countdown_turtle.write(str(i), align="center", font=("Courier", 64, "bold"))
+    screen.ontimer(lambda: countdown_step(i - 1, token), 1000)
 
 # --- Game Setup ---
 food = Food()
@@ -185,93 +203,112 @@ screen.listen()
 def set_up():
     global next_direction
     if allow_movement:
-        next_direction = 'up'
+        next_direction = UP
 def set_down():
     global next_direction
     if allow_movement:
-        next_direction = 'down'
+        next_direction = DOWN
 def set_left():
     global next_direction
     if allow_movement:
-        next_direction = 'left'
+        next_direction = LEFT
 def set_right():
     global next_direction
     if allow_movement:
-        next_direction = 'right'
+        next_direction = RIGHT
 
 screen.onkey(set_up, "Up")
 screen.onkey(set_down, "Down")
 screen.onkey(set_left, "Left")
 screen.onkey(set_right, "Right")
 
-def move_and_update():
+# Keyed by the snake's heading constants, so a turn is one dict lookup
+DIR_DISPATCH = {UP: snake.up, DOWN: snake.down, LEFT: snake.left, RIGHT: snake.right}
+
+def render():
+    # Draw step: one screen.update() per frame, and only if the logic changed something
+    global is_game_on
     try:
-        food.showturtle()
-        for segment in snake.segments:
-            segment.showturtle()
-        screen.update()
+        score_changed = scoreboard.flush()
+        if snake.dirty or food.dirty or score_changed:
+            snake.draw()
+            food.dirty = False
+            screen.update()
+        screen.ontimer(render, RENDER_INTERVAL)
     except _tkinter.TclError:
         print("Game closed.")
-        global is_game_on
         is_game_on = False
 
 def apply_next_direction():
     global next_direction
-    if next_direction == 'up':
-        snake.up()
-    elif next_direction == 'down':
-        snake.down()
-    elif next_direction == 'left':
-        snake.left()
-    elif next_direction == 'right':
-        snake.right()
+    turn = DIR_DISPATCH.get(next_direction)
+    if turn:
+        turn()
     next_direction = None
 
-def game_loop():
+def tick_logic():
+    # Update step: move the snake and resolve collisions, no drawing
     global is_game_on, is_game_over
+    if is_game_on and game_started and allow_movement and not is_paused and not is_game_over:
+        apply_next_direction()
+        snake.move()
+        # read positions once per tick; the snake's head comes from its arrays
+        hx, hy = snake.head_position()
+        fx, fy = food.position()
+        limit = PLAY_AREA_LIMIT
+        # detect collision with the food (exact grid match)
+        if round(hx / GRID_SIZE) == round(fx / GRID_SIZE) and round(hy / GRID_SIZE) == round(fy / GRID_SIZE):
+            food.refresh(snake.occupied)
+            snake.extend()
+            scoreboard.increase_score()
+        # detect collision with the wall
+        if hx > limit or hx < -limit or hy > limit or hy < -limit:
+            scoreboard.lose_life()
+            if scoreboard.lives == 0:
+                is_game_on = False
+                is_game_over = True
+                clear_all_text()
+                show_gameover_explanation()
+            else:
+                snake.reset()
+        # detect collision with the tail (O(1) lookup in the occupied-cell counts)
+        if snake.hits_tail():
+            scoreboard.lose_life()
+            if scoreboard.lives == 0:
+                is_game_on = False
+                is_game_over = True
+                clear_all_text()
+                show_gameover_explanation()
+            else:
+                snake.reset()
+
+def game_loop():
+    # Fixed timestep: run one logic step per GAME_SPEED ms of wall time, catching up
+    # if Tk fired late, then schedule the next call for when the next step is due
+    global is_game_on, last_logic_ts
     try:
-        if is_game_on and game_started and not is_paused and not is_game_over:
-            move_and_update()
-            apply_next_direction()
-            snake.move()
-            # detect collision with the food (exact grid match)
-            if (round(snake.head.xcor()) == round(food.xcor()) and round(snake.head.ycor()) == round(food.ycor())):
-                food.refresh()
-                snake.extend()
-                scoreboard.increase_score()
-            # detect collision with the wall
-            if (
-                snake.head.xcor() > PLAY_AREA_LIMIT or snake.head.xcor() < -PLAY_AREA_LIMIT or
-                snake.head.ycor() > PLAY_AREA_LIMIT or snake.head.ycor() < -PLAY_AREA_LIMIT
-            ):
-                scoreboard.lose_life()
-                if scoreboard.lives == 0:
-                    is_game_on = False
-                    is_game_over = True
-                    clear_all_text()
-                    show_gameover_explanation()
-                else:
-                    snake.reset()
-            # detect collision with the tail
-            for segment in snake.segments[1:]:
-                if snake.head.distance(segment) < 10:
-                    scoreboard.lose_life()
-                    if scoreboard.lives == 0:
-                        is_game_on = False
-                        is_game_over = True
-                        clear_all_text()
-                        show_gameover_explanation()
-                    else:
-                        snake.reset()
-                    break
-        screen.ontimer(game_loop, GAME_SPEED)
+        step = GAME_SPEED / 1000
+        now = time.perf_counter()
+        if now - last_logic_ts > MAX_CATCH_UP_STEPS * step:
+            last_logic_ts = now - step
+        while now - last_logic_ts >= step:
+            tick_logic()
+            last_logic_ts += step
+        delay = int((last_logic_ts + step - time.perf_counter()) * 1000)
+        screen.ontimer(game_loop, max(1, delay))
     except _tkinter.TclError:
         print("Game closed.")
         is_game_on = False
 
 def start_snake_game():
+    global loop_running, last_logic_ts
     show_bottom_text("SPACE to pause | P for new game | Q to quit")
-    screen.ontimer(game_loop, GAME_SPEED)
+    last_logic_ts = time.perf_counter()
+    # Logic and render timers are started once and keep running across new games
+    if not loop_running:
+        loop_running = True
+        screen.ontimer(game_loop, GAME_SPEED)
+        screen.ontimer(render, RENDER_INTERVAL)
     screen.exitonclick()
 
 if __name__ == "__main__":
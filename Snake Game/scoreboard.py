@@ -1,34 +1,49 @@
+from pathlib import Path
 from turtle import Turtle
 ALIGNMENT = "center"
 FONT = ("Courier", 25, "normal")
+DATA_FILE = Path("data.txt")
 
 class Scoreboard(Turtle):
     def __init__(self, lives=3):
         super().__init__()
         self.score = 0
         self.lives = lives
-        try:
-            with open("data.txt") as data:
-                self.highscore = int(data.read())
-        except FileNotFoundError:
-            with open("data.txt", "w") as data:
-                data.write("0")
+        self._dirty = True
+        self._last_text = None
+        # One stat and one read; a missing file is created without reading it back
+        if DATA_FILE.exists():
+            self.highscore = int(DATA_FILE.read_text())
+        else:
+            DATA_FILE.write_text("0")
             self.highscore = 0
         self.color("white")
         self.penup()
         self.goto(0, 370)  # Move score/lives display to top for separation
         self.hideturtle()
-        self.update_score()
+        self.flush()
 
     def update_score(self):
+        # Just mark the text stale; the render tick redraws it at most once per frame
+        self._dirty = True
+
+    def flush(self):
+        # Returns True if the text was redrawn, so the caller knows a screen update is due
+        if not self._dirty:
+            return False
+        self._dirty = False
+        text = f"Score: {self.score}  HighScore: {self.highscore}  Lives: {self.lives}"
+        if text == self._last_text:
+            return False
+        self._last_text = text
         self.clear()
-        self.write(f"Score: {self.score}  HighScore: {self.highscore}  Lives: {self.lives}", align=ALIGNMENT, font=FONT)
+        self.write(text, align=ALIGNMENT, font=FONT)
+        return True
 
     def reset(self):
         if self.score > self.highscore:
             self.highscore = self.score
-            with open("data.txt", "w") as data:
-                data.write(f"{self.highscore}")
+            DATA_FILE.write_text(f"{self.highscore}")
         self.score = 0
         self.update_score()
 
@@ -1,3 +1,5 @@
+from array import array
+from collections import Counter
 from turtle import Turtle
 STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
 MOVE_DISTANCE = 20
@@ -6,11 +8,31 @@ DOWN = 270
 RIGHT = 0
 LEFT = 180
 
+
+def grid_cell(x, y):
+    # Integer grid coordinates of a position; absorbs turtle's float drift
+    return (round(x / MOVE_DISTANCE), round(y / MOVE_DISTANCE))
+
+
+# Grid step for each heading, so move() never asks a turtle where it is
+STEPS = {UP: (0, MOVE_DISTANCE), DOWN: (0, -MOVE_DISTANCE), RIGHT: (MOVE_DISTANCE, 0), LEFT: (-MOVE_DISTANCE, 0)}
+
+
 class Snake:
     def __init__(self):
+        # Positions live in two flat arrays; the turtles only mirror them on draw()
+        self.xs = array("d")
+        self.ys = array("d")
         self.segments = []
+        # Parked turtles, reused by extend()/reset() instead of creating new ones
+        self._pool = []
+        self.heading = RIGHT
+        # Set whenever the positions change, cleared once draw() has caught up
+        self.dirty = True
+        # How many segments sit in each grid cell, kept in step with move()/extend()
+        self.occupied = Counter()
         self.create_snake()
-        self.head = self.segments[0]
+        self.head_cell = grid_cell(self.xs[0], self.ys[0])
 
     def create_snake(self):
         for position in STARTING_POSITIONS:
@@ -18,37 +40,76 @@ class Snake:
 
     def reset(self):
         for seg in self.segments:
+            seg.hideturtle()
             seg.goto(1000, 1000)
+        self._pool.extend(self.segments)
         self.segments.clear()
+        del self.xs[:]
+        del self.ys[:]
+        self.occupied.clear()
+        self.heading = RIGHT
+        self.dirty = True
         self.create_snake()
-        self.head = self.segments[0]
+        self.head_cell = grid_cell(self.xs[0], self.ys[0])
 
     def add_segment(self, position):
-        new_segment = Turtle("square")
-        new_segment.penup()
-        new_segment.color("white")
+        if self._pool:
+            new_segment = self._pool.pop()
+            new_segment.showturtle()
+        else:
+            new_segment = Turtle("square")
+            new_segment.penup()
+            new_segment.color("white")
         new_segment.goto(position)
         self.segments.append(new_segment)
+        self.xs.append(position[0])
+        self.ys.append(position[1])
+        self.occupied[grid_cell(*position)] += 1
+        self.dirty = True
 
     def extend(self):
-        self.add_segment(self.segments[-1].position())
+        self.add_segment((self.xs[-1], self.ys[-1]))
 
     def move(self):
-        for seg_num in range(len(self.segments) - 1, 0, -1):
-            new_x = self.segments[seg_num - 1].xcor()
-            new_y = self.segments[seg_num - 1].ycor()
-            self.segments[seg_num].goto(new_x, new_y)
-        self.segments[0].forward(MOVE_DISTANCE)
+        # Every segment shifts forward one slot, so only the tail cell is vacated
+        xs, ys = self.xs, self.ys
+        tail_cell = grid_cell(xs[-1], ys[-1])
+        self.occupied[tail_cell] -= 1
+        if not self.occupied[tail_cell]:
+            del self.occupied[tail_cell]
+        xs[1:] = xs[:-1]
+        ys[1:] = ys[:-1]
+        dx, dy = STEPS[self.heading]
+        xs[0] += dx
+        ys[0] += dy
+        self.head_cell = grid_cell(xs[0], ys[0])
+        self.occupied[self.head_cell] += 1
+        self.dirty = True
+
+    def draw(self):
+        # Copy the array positions onto the turtles; called once per rendered frame
+        if not self.dirty:
+            return
+        self.dirty = False
+        for seg, x, y in zip(self.segments, self.xs, self.ys):
+            seg.goto(x, y)
+
+    def head_position(self):
+        return self.xs[0], self.ys[0]
+
+    def hits_tail(self):
+        # The head shares its cell with another segment
+        return self.occupied[self.head_cell] > 1
 
     def up(self):
-        if self.head.heading() != DOWN:
-            self.head.setheading(UP)
+        if self.heading != DOWN:
+            self.heading = UP
     def down(self):
-        if self.head.heading() != UP:
-            self.head.setheading(DOWN)
+        if self.heading != UP:
+            self.heading = DOWN
     def left(self):
-        if self.head.heading() != RIGHT:
-            self.head.setheading(LEFT)
+        if self.heading != RIGHT:
+            self.heading = LEFT
     def right(self):
-        if self.head.heading() != LEFT:
-            self.head.setheading(RIGHT)
\ No newline at end of file
+        if self.heading != LEFT:
+            self.heading = RIGHT
\ No newline at end of file
@@ -1,13 +1,26 @@
 import cgi
+import functools
 import http.server
-import socketserver
+import logging
+import math
 import os
 import subprocess
+import threading
 import hashlib
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
 from urllib.parse import parse_qs
-from pywebcopy import save_webpage
+from pywebcopy.configs import get_config
+from pywebcopy.schedulers import thread_pool_default_scheduler
 
-LOG_FILE = "cloner.log"
+# Next to the script: the handler opens it at import, before the chdir below
+LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cloner.log")
+HTTRACK_SOCKETS = 8
+PYWEBCOPY_WORKERS = 8
+LOG_FLUSH_INTERVAL = 0.1
 README_TEMPLATE = """
 # Docker Website Container
 
@@ -32,8 +45,149 @@ This folder contains a Docker image exported as a .tar file, ready to be loaded
 - The Dockerfile is included for reference or customization.
 
 ---
-MD5 of image: {md5_hash}
+SHA-256 of {docker_tar}: {image_digest}
 """
+# Bound once so each request skips the attribute lookup on the template
+render_readme = README_TEMPLATE.format
+# The Dockerfile never varies, so keep it as ready-to-write bytes
+DOCKERFILE = b"""
+FROM nginx:alpine
+COPY . /usr/share/nginx/html
+EXPOSE 80
+CMD ["nginx", "-g", "daemon off;"]
+"""
+
+# One handler keeps the log file open instead of reopening it per message
+logger = logging.getLogger("cloner")
+_log_handler = logging.FileHandler(LOG_FILE)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# docker_names with a clone/build in progress, guarded by the lock
+_active_jobs = set()
+_active_jobs_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def docker_available():
+    """Return True if the docker CLI can be run; checked once per server run."""
+    try:
+        return subprocess.run(["docker", "--version"], capture_output=True).returncode == 0
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def httrack_available():
+    """Return True if the HTTrack CLI is on PATH."""
+    return shutil.which("httrack") is not None
+
+
+def clone_with_httrack(url, project_folder):
+    """Mirror the page and its requisites with HTTrack's parallel fetcher."""
+    httrack_cmd = [
+        "httrack", url,
+        "-O", str(project_folder),
+        "--depth=2",
+        "--near",
+        f"--sockets={HTTRACK_SOCKETS}",
+        "--keep-alive",
+        "--quiet",
+    ]
+    result = subprocess.run(httrack_cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"httrack exited with code {result.returncode}")
+
+
+class _DrainablePool(ThreadPoolExecutor):
+    """Thread pool that remembers its futures so callers can wait for nested submissions."""
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.futures = []
+        self._futures_lock = threading.Lock()
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        with self._futures_lock:
+            self.futures.append(future)
+        return future
+
+    def drain(self):
+        """Block until every submitted task, including ones queued by other tasks, is done.
+        Returns the exceptions raised by failed tasks."""
+        while True:
+            with self._futures_lock:
+                pending = [f for f in self.futures if not f.done()]
+            if not pending:
+                break
+            # A page's task queues its assets before it finishes, so once nothing
+            # is pending nothing new can arrive
+            wait(pending)
+        return [f.exception() for f in self.futures if f.exception() is not None]
+
+
+def clone_with_pywebcopy(url, project_folder, project_name, delay=None):
+    """Save the page and its assets with pywebcopy on a bounded download pool.
+
+    With a delay, downloads run one at a time and pause `delay` seconds after each response.
+    Returns only once every asset has been fetched, with the list of download errors.
+    """
+    config = get_config(url, str(project_folder), project_name, delay=delay)
+    page = config.create_page()
+    # pywebcopy accepts a delay but never sleeps on it, so enforce it on the session
+    # every resource shares, and drop to one worker so requests are really spaced out
+    workers = PYWEBCOPY_WORKERS
+    if delay:
+        workers = 1
+        page.session.hooks["response"].append(lambda response, *args, **kwargs: time.sleep(delay))
+    # pywebcopy's own threaded mode starts a thread per asset and never joins them,
+    # so swap in its pool scheduler, backed by a pool we can wait on
+    scheduler = thread_pool_default_scheduler(maxsize=workers)
+    scheduler.pool.shutdown(wait=False)
+    scheduler.pool = pool = _DrainablePool(workers)
+    page.scheduler = scheduler
+    try:
+        page.get(url)
+        page.save_complete(pop=False)
+        return pool.drain()
+    finally:
+        scheduler.close(wait=True)
+
+
+def write_dockerfile(project_folder):
+    """Write the Nginx Dockerfile used to serve the cloned site."""
+    Path(project_folder, "Dockerfile").write_bytes(DOCKERFILE)
+
+
+def write_nginx_conf(project_folder):
+    """Write a placeholder nginx.conf for advanced users to edit."""
+    Path(project_folder, "nginx.conf").write_text(
+        "# Default Nginx config. Edit as needed.\n", encoding="utf-8"
+    )
+
+
+def write_dockerignore(project_folder):
+    """Keep build files and stray image tarballs out of the build context."""
+    Path(project_folder, ".dockerignore").write_text(
+        "Dockerfile\n.dockerignore\n*.tar\n", encoding="utf-8"
+    )
+
+
+def sha256_file(path):
+    """Return the SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        # Reuse one buffer instead of allocating a new bytes object per chunk
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            h.update(buf[:n])
+    return h.hexdigest()
+
 
 class RequestHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
@@ -51,90 +205,147 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
         url = form.get("website_url", [""])[0]
         docker_name = form.get("docker_name", [""])[0]
         save_path = form.get("save_path", [""])[0]
-        project_folder = os.path.join('./cloned_sites', docker_name)
+        if not url or not docker_name or not save_path:
+            self.send_error(400, "Bad Request: Missing fields")
+            return
+        # Optional politeness delay between requests to the same host
+        try:
+            crawl_delay = float(form.get("crawl_delay", [""])[0] or 0)
+            # float() also accepts "nan", "inf" and negatives, none of which is a delay
+            if not math.isfinite(crawl_delay) or crawl_delay < 0:
+                raise ValueError(crawl_delay)
+        except ValueError:
+            self.send_error(400, "Bad Request: Invalid crawl delay")
+            return
+        crawl_delay = crawl_delay or None
+        if not docker_available():
+            self.send_error(500, "Docker is not installed or not on PATH")
+            return
+        # Requests run on their own threads; two jobs for one name would share
+        # the cloned_sites folder and the image tag, so only one may run at a time
+        # (lowercased: tags are, and the folder may be on a case-insensitive disk)
+        job_key = docker_name.lower()
+        with _active_jobs_lock:
+            if job_key in _active_jobs:
+                self.send_error(409, f"Conflict: a job for {docker_name} is already running")
+                return
+            _active_jobs.add(job_key)
+        try:
+            self._clone_and_build(url, docker_name, save_path, crawl_delay)
+        finally:
+            with _active_jobs_lock:
+                _active_jobs.discard(job_key)
+
+    def _clone_and_build(self, url, docker_name, save_path, crawl_delay):
+        project_folder = Path("cloned_sites") / docker_name
         log_entries = []
 
         def log(msg):
             log_entries.append(msg)
-            with open(LOG_FILE, "a") as f:
-                f.write(msg + "\n")
-
-        if not url or not docker_name or not save_path:
-            self.send_error(400, "Bad Request: Missing fields")
-            return
+            logger.info(msg)
 
         urlN = url if url.startswith("http") else "https://" + url.strip("/")
-        if not os.path.isdir(project_folder):
-            os.makedirs(project_folder, exist_ok=True)
+        needs_clone = not project_folder.is_dir()
+        project_folder.mkdir(parents=True, exist_ok=True)
+        # The Docker build files don't depend on the clone, so write them meanwhile
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            metadata = [
+                pool.submit(write_dockerfile, project_folder),
+                pool.submit(write_nginx_conf, project_folder),
+                pool.submit(write_dockerignore, project_folder),
+            ]
+            if needs_clone:
+                try:
+                    log(f"Cloning {urlN} to {project_folder}")
+                    # HTTrack has no per-request delay, so a delayed clone goes through pywebcopy
+                    if httrack_available() and crawl_delay is None:
+                        clone_with_httrack(urlN, project_folder)
+                    else:
+                        failures = clone_with_pywebcopy(urlN, project_folder, docker_name, crawl_delay)
+                        for err in failures:
+                            log(f"Asset download failed: {err}")
+                    log("Cloning complete.")
+                except Exception as e:
+                    log(f"Error cloning website: {e}")
+                    self.send_error(500, f"Error cloning website: {e}")
+                    return
             try:
-                log(f"Cloning {urlN} to {project_folder}")
-                save_webpage(
-                    url=urlN,
-                    project_folder=project_folder,
-                    project_name=docker_name
-                )
-                log("Cloning complete.")
+                for future in metadata:
+                    future.result()
             except Exception as e:
-                log(f"Error cloning website: {e}")
-                self.send_error(500, f"Error cloning website: {e}")
+                log(f"Error writing Docker build files: {e}")
+                self.send_error(500, f"Error writing Docker build files: {e}")
                 return
-        # Write Dockerfile for Nginx
-        dockerfile_path = os.path.join(project_folder, "Dockerfile")
-        with open(dockerfile_path, "w") as f:
-            f.write(f"""
-FROM nginx:alpine
-COPY . /usr/share/nginx/html
-EXPOSE 80
-CMD [\"nginx\", \"-g\", \"daemon off;\"]
-""")
         log("Dockerfile created.")
-        # Optionally write nginx.conf for advanced users
-        nginx_conf_path = os.path.join(project_folder, "nginx.conf")
-        with open(nginx_conf_path, "w") as f:
-            f.write("# Default Nginx config. Edit as needed.\n")
         # Build Docker image
-        build_cmd = ["docker", "build", "-t", docker_name, project_folder]
+        build_cmd = ["docker", "build", "-t", docker_name, str(project_folder)]
+        # BuildKit hashes and transfers the context in parallel; plain progress keeps the log readable
+        build_env = {**os.environ, "DOCKER_BUILDKIT": "1", "BUILDKIT_PROGRESS": "plain"}
         try:
             log(f"Building Docker image: {docker_name}")
-            result = subprocess.run(build_cmd, capture_output=True, text=True)
-            log(result.stdout)
-            log(result.stderr)
-            if result.returncode != 0:
-                log(f"Docker build failed: {result.stderr}")
-                self.send_error(500, f"Docker build failed: {result.stderr}")
+            # Stream build output as it arrives instead of buffering it all until exit
+            proc = subprocess.Popen(
+                build_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                env=build_env
+            )
+            build_tail = deque(maxlen=20)
+            # Log build output in ~100 ms batches rather than one write per line
+            pending = []
+            last_flush = time.monotonic()
+            for line in proc.stdout:
+                line = line.rstrip()
+                build_tail.append(line)
+                pending.append(line)
+                now = time.monotonic()
+                if now - last_flush >= LOG_FLUSH_INTERVAL:
+                    log("\n".join(pending))
+                    pending.clear()
+                    last_flush = now
+            if pending:
+                log("\n".join(pending))
+            returncode = proc.wait()
+            if returncode != 0:
+                log("Docker build failed:\n" + "\n".join(build_tail))
+                # The status line must stay on one line, so the output goes in the error body
+                self.send_error(500, f"Docker build failed with exit code {returncode}", "\n".join(build_tail))
                 return
             log("Docker build complete.")
         except Exception as e:
             log(f"Error building Docker image: {e}")
             self.send_error(500, f"Error building Docker image: {e}")
             return
-        # Get image ID and calculate MD5
+        # Get image ID, save the image and checksum the exported tar
         try:
             inspect_cmd = ["docker", "images", "--format", "{{.ID}}", docker_name]
             image_id = subprocess.check_output(inspect_cmd, text=True).strip()
-            md5_hash = hashlib.md5(image_id.encode()).hexdigest()
             log(f"Docker image ID: {image_id}")
-            log(f"MD5: {md5_hash}")
             # Save image to tar file in chosen location
-            docker_tar = os.path.join(save_path, f"{docker_name}.tar")
-            save_cmd = ["docker", "save", "-o", docker_tar, docker_name]
+            docker_tar = Path(save_path) / f"{docker_name}.tar"
+            save_cmd = ["docker", "save", "-o", str(docker_tar), docker_name]
             try:
                 subprocess.run(save_cmd, check=True)
                 log(f"Image saved to: {docker_tar}")
+                # Hash the tarball itself so the README checksum can verify the download
+                image_digest = sha256_file(docker_tar)
             except Exception as e:
                 log(f"Error saving image: {e}")
+                image_digest = "unavailable (image was not saved)"
+            log(f"SHA-256: {image_digest}")
             # Write README
-            readme_path = os.path.join(save_path, f"README_{docker_name}.md")
-            with open(readme_path, "w") as f:
-                f.write(README_TEMPLATE.format(
-                    docker_tar=f"{docker_name}.tar",
-                    docker_name=docker_name,
-                    md5_hash=md5_hash
-                ))
+            readme_path = Path(save_path) / f"README_{docker_name}.md"
+            readme_path.write_text(render_readme(
+                docker_tar=f"{docker_name}.tar",
+                docker_name=docker_name,
+                image_digest=image_digest
+            ), encoding="utf-8")
             log(f"README created: {readme_path}")
         except Exception as e:
             log(f"Error getting image ID: {e}")
-        # Respond with log and MD5
+        # Respond with log and checksum
         self.send_response(200)
         self.send_header("Content-type", "text/plain")
         self.end_headers()
@@ -142,10 +353,11 @@ CMD [\"nginx\", \"-g\", \"daemon off;\"]
 
 
 PORT = 7000
-os.makedirs("cloned_sites", exist_ok=True)
+Path("cloned_sites").mkdir(exist_ok=True)
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-with socketserver.TCPServer(("127.0.0.1", PORT), RequestHandler) as s:
+# One thread per request, so a long clone/build doesn't block the form or other jobs
+with http.server.ThreadingHTTPServer(("127.0.0.1", PORT), RequestHandler) as s:
     s.allow_reuse_address = True
     print(f"Server running on http://127.0.0.1:{PORT}")
     s.serve_forever()